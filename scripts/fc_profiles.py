@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Farcaster Profile Resolver
+
+Bulk address -> Farcaster profile lookups for leaderboard and replay tooling.
+Mirrors the contract of app/api/fc/users-by-address:
+- POST {"addresses": [...]} -> {"result": [{"address", "users": [{fid, username, pfp}]}]}
+- Addresses are normalized to lowercase and deduplicated
+- The first matched user is used as the profile (same as app/lib/farcaster-profiles.ts)
+
+Lookups are batched into maximum-size requests, sent concurrently with asyncio
+under a bounded semaphore over a pool of keep-alive connections, and cached on
+disk (SQLite) with a TTL and LRU eviction.
+"""
+
+import asyncio
+import http.client
+import json
+import queue
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+# ============ CONSTANTS ============
+
+DEFAULT_BASE_URL = "http://localhost:3000"
+USERS_BY_ADDRESS_PATH = "/api/fc/users-by-address"
+
+# Neynar bulk-by-address accepts at most 350 addresses per call
+MAX_ADDRESSES_PER_REQUEST = 350
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 30.0
+
+# Cache settings: profiles change rarely and reports are re-run over days,
+# so keep entries for a week (override with --ttl)
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60
+DEFAULT_CACHE_MAX_ENTRIES = 500_000
+
+# SQLite's default limit on bound parameters per statement is 999
+SQLITE_MAX_PARAMS = 900
+
+@dataclass
+class FarcasterProfile:
+    """Farcaster profile matched to a wallet address"""
+    fid: int
+    username: Optional[str]
+    pfp: Optional[str]
+    wallet_address: str
+
+def normalize_addresses(addresses: Iterable[str]) -> List[str]:
+    """
+    Lowercase and deduplicate addresses, preserving first-seen order
+
+    Args:
+        addresses: Raw wallet addresses
+
+    Returns:
+        Unique lowercase addresses
+    """
+    return list(dict.fromkeys(a.strip().lower() for a in addresses if a and a.strip()))
+
+def chunk(items: List[str], size: int) -> List[List[str]]:
+    """Split items into consecutive chunks of at most `size` elements"""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+# ============ CACHE ============
+
+class ProfileCache:
+    """
+    On-disk TTL/LRU cache of address -> profile lookups
+
+    Misses (addresses without a Farcaster account) are cached too, so repeated
+    reports do not re-query them. Entries older than `ttl` seconds are ignored
+    and the least recently used entries are evicted past `max_entries`.
+    """
+
+    def __init__(self, path: str, ttl: float = DEFAULT_CACHE_TTL,
+                 max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS profiles ("
+            " address TEXT PRIMARY KEY,"
+            " profile TEXT,"
+            " stored_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS profiles_accessed_at ON profiles (accessed_at)"
+        )
+        self._db.commit()
+
+    def get_many(self, addresses: List[str]) -> Dict[str, Optional[FarcasterProfile]]:
+        """
+        Look up fresh cache entries
+
+        Args:
+            addresses: Normalized addresses
+
+        Returns:
+            Mapping for cache hits only (value is None for cached misses)
+        """
+        now = time.time()
+        hits: Dict[str, Optional[FarcasterProfile]] = {}
+        for batch in chunk(addresses, SQLITE_MAX_PARAMS):
+            placeholders = ",".join("?" * len(batch))
+            rows = self._db.execute(
+                f"SELECT address, profile FROM profiles"
+                f" WHERE address IN ({placeholders}) AND stored_at >= ?",
+                (*batch, now - self.ttl),
+            ).fetchall()
+            for address, profile in rows:
+                hits[address] = FarcasterProfile(**json.loads(profile)) if profile else None
+
+        if hits:
+            self._db.executemany(
+                "UPDATE profiles SET accessed_at = ? WHERE address = ?",
+                [(now, address) for address in hits],
+            )
+            self._db.commit()
+        return hits
+
+    def set_many(self, profiles: Dict[str, Optional[FarcasterProfile]]) -> None:
+        """Store lookups and evict least recently used entries past max_entries"""
+        if not profiles:
+            return
+        now = time.time()
+        self._db.executemany(
+            "INSERT OR REPLACE INTO profiles (address, profile, stored_at, accessed_at)"
+            " VALUES (?, ?, ?, ?)",
+            [
+                (address, json.dumps(asdict(profile)) if profile else None, now, now)
+                for address, profile in profiles.items()
+            ],
+        )
+        self._evict()
+        self._db.commit()
+
+    def _evict(self) -> None:
+        (count,) = self._db.execute("SELECT COUNT(*) FROM profiles").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM profiles WHERE address IN"
+                " (SELECT address FROM profiles ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,),
+            )
+
+    def __len__(self) -> int:
+        (count,) = self._db.execute("SELECT COUNT(*) FROM profiles").fetchone()
+        return count
+
+    def clear(self) -> None:
+        """Remove all cached entries"""
+        self._db.execute("DELETE FROM profiles")
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+# ============ HTTP ============
+
+class ConnectionPool:
+    """
+    Fixed-size pool of keep-alive HTTP(S) connections to a single host
+
+    Connections are blocking http.client objects; callers run requests in a
+    worker thread (see ProfileResolver._post) so the event loop is not blocked.
+    """
+
+    def __init__(self, base_url: str, size: int, timeout: float = DEFAULT_TIMEOUT):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {base_url}")
+        self._conn_cls = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._netloc = parts.netloc
+        self._timeout = timeout
+        self.prefix = parts.path.rstrip("/")
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        for _ in range(size):
+            self._idle.put(self._conn_cls(self._netloc, timeout=self._timeout))
+
+    def post_json(self, path: str, payload: dict) -> dict:
+        """POST a JSON payload and decode the JSON response (blocking)"""
+        body = json.dumps(payload).encode()
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        conn = self._idle.get()
+        try:
+            try:
+                conn.request("POST", self.prefix + path, body=body, headers=headers)
+                response = conn.getresponse()
+            except (http.client.HTTPException, ConnectionError):
+                # Server closed an idle keep-alive connection; reconnect once
+                conn.close()
+                conn = self._conn_cls(self._netloc, timeout=self._timeout)
+                conn.request("POST", self.prefix + path, body=body, headers=headers)
+                response = conn.getresponse()
+
+            data = response.read()
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status}: {data[:200]!r}")
+            return json.loads(data)
+        except Exception:
+            conn.close()
+            raise
+        finally:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+# ============ RESOLVER ============
+
+class ProfileResolver:
+    """
+    Bulk resolver of wallet addresses to Farcaster profiles
+
+    Usage:
+        resolver = ProfileResolver("https://degen-guessr.vercel.app",
+                                   cache=ProfileCache(".fc_profiles.sqlite"))
+        profiles = resolver.resolve(addresses)
+    """
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL,
+                 cache: Optional[ProfileCache] = None,
+                 batch_size: int = MAX_ADDRESSES_PER_REQUEST,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 timeout: float = DEFAULT_TIMEOUT):
+        if batch_size < 1 or max_concurrency < 1:
+            raise ValueError("batch_size and max_concurrency must be positive")
+        self.cache = cache
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.pool = ConnectionPool(base_url, size=max_concurrency, timeout=timeout)
+
+        # Lookup statistics
+        self.round_trips = 0
+        self.cache_hits = 0
+        self.failed_batches = 0
+
+    def resolve(self, addresses: Iterable[str]) -> Dict[str, Optional[FarcasterProfile]]:
+        """Synchronous wrapper around resolve_async"""
+        return asyncio.run(self.resolve_async(addresses))
+
+    async def resolve_async(self, addresses: Iterable[str]) -> Dict[str, Optional[FarcasterProfile]]:
+        """
+        Resolve addresses to profiles
+
+        Args:
+            addresses: Wallet addresses (any case, duplicates allowed)
+
+        Returns:
+            Mapping of lowercase address -> profile (None if no Farcaster account
+            or the lookup failed)
+        """
+        addrs = normalize_addresses(addresses)
+        results: Dict[str, Optional[FarcasterProfile]] = {}
+
+        if self.cache is not None:
+            results.update(self.cache.get_many(addrs))
+            self.cache_hits += len(results)
+
+        missing = [a for a in addrs if a not in results]
+        if missing:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            batches = chunk(missing, self.batch_size)
+            fetched = await asyncio.gather(*(self._fetch_batch(b, semaphore) for b in batches))
+
+            for batch, profiles in zip(batches, fetched):
+                if profiles is None:
+                    # Don't cache failures - retry on the next run
+                    results.update(dict.fromkeys(batch))
+                    continue
+                results.update(profiles)
+                if self.cache is not None:
+                    self.cache.set_many(profiles)
+
+        return {a: results[a] for a in addrs}
+
+    async def _fetch_batch(self, batch: List[str],
+                           semaphore: asyncio.Semaphore) -> Optional[Dict[str, Optional[FarcasterProfile]]]:
+        async with semaphore:
+            self.round_trips += 1
+            try:
+                response = await asyncio.to_thread(
+                    self.pool.post_json, USERS_BY_ADDRESS_PATH, {"addresses": batch}
+                )
+            except Exception as e:
+                self.failed_batches += 1
+                print(f"⚠️  Profile lookup failed for {len(batch)} addresses: {e}", file=sys.stderr)
+                return None
+
+        by_address = {r["address"].lower(): r.get("users") or [] for r in response.get("result", [])}
+
+        # The route answers errors with 200 {"result": []}; on success every
+        # requested address has an entry, so anything missing is a failure
+        missing = [a for a in batch if a not in by_address]
+        if missing:
+            self.failed_batches += 1
+            print(f"⚠️  Profile lookup returned no entry for {len(missing)}/{len(batch)} addresses",
+                  file=sys.stderr)
+            return None
+
+        profiles: Dict[str, Optional[FarcasterProfile]] = {}
+        for address in batch:
+            users = by_address[address]
+            if users:
+                # Use the first user (same selection as the frontend)
+                user = users[0]
+                profiles[address] = FarcasterProfile(
+                    fid=user["fid"],
+                    username=user.get("username"),
+                    pfp=user.get("pfp"),
+                    wallet_address=address,
+                )
+            else:
+                profiles[address] = None
+        return profiles
+
+    def close(self) -> None:
+        self.pool.close()
+        if self.cache is not None:
+            self.cache.close()
+
+def main():
+    """Resolve addresses from stdin (one per line) and print JSON to stdout"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--cache", default=".fc_profiles.sqlite", help="SQLite cache path")
+    parser.add_argument("--ttl", type=float, default=DEFAULT_CACHE_TTL, help="Cache TTL in seconds")
+    parser.add_argument("--batch-size", type=int, default=MAX_ADDRESSES_PER_REQUEST)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY)
+    args = parser.parse_args()
+
+    resolver = ProfileResolver(
+        args.base_url,
+        cache=ProfileCache(args.cache, ttl=args.ttl),
+        batch_size=args.batch_size,
+        max_concurrency=args.concurrency,
+    )
+    try:
+        start = time.perf_counter()
+        profiles = resolver.resolve(sys.stdin.read().split())
+        elapsed = time.perf_counter() - start
+    finally:
+        resolver.close()
+
+    json.dump({a: asdict(p) if p else None for a, p in profiles.items()}, sys.stdout, indent=2)
+    print()
+    found = sum(1 for p in profiles.values() if p)
+    print(f"🔍 Resolved {found:,}/{len(profiles):,} addresses in {elapsed:.2f}s "
+          f"({resolver.round_trips} round trips, {resolver.cache_hits:,} cache hits)",
+          file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
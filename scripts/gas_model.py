@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+DegenSlot Gas Cost Model
+
+Estimates on-chain gas for spin() and the fulfillRandomWords callback,
+annotated per code path in contracts/DegenSlot.sol:
+- Free (NFT) spin vs paid spin
+- Payout vs no payout
+- Cold vs warm / fresh vs dirty storage slots (EIP-2929 / EIP-2200)
+
+Spins are driven by the simulator's category mix (contract-faithful rolls)
+and a player population, vectorized with NumPy over millions of spins, to
+produce gas/spin distributions and the sustainable (EIP-1559 gas target)
+and peak (gas limit) spins per block.
+
+Costs are an analytic model of the Solidity source, not a trace: opcode
+costs are exact, while external-call bodies (ERC20, VRF coordinator) and
+dispatch overhead are estimates. Override GasParams with measured values
+(e.g. from `forge test --gas-report`) to calibrate.
+"""
+
+import argparse
+from dataclasses import dataclass, field, replace
+from typing import Dict, Tuple
+
+import numpy as np
+
+try:
+    from scripts.slot_simulator import Cat, CATEGORY_RANGES, ROLL_MODULUS, contract_rolls
+except ImportError:
+    from slot_simulator import Cat, CATEGORY_RANGES, ROLL_MODULUS, contract_rolls
+
+# ============ EVM GAS SCHEDULE (Cancun) ============
+
+TX_BASE = 21000
+CALLDATA_NONZERO_BYTE = 16
+COLD_SLOAD = 2100             # EIP-2929 first access to a slot in the tx
+WARM_SLOAD = 100
+COLD_ACCOUNT_ACCESS = 2600    # EIP-2929 first CALL to an address in the tx
+SSTORE_SET = 20000            # zero -> nonzero (fresh slot)
+SSTORE_RESET = 2900           # nonzero -> different value (dirty slot)
+SSTORE_CLEAR_REFUND = 4800    # nonzero -> zero
+SSTORE_RESTORE_REFUND = 2800  # slot restored to its original nonzero value
+MAX_REFUND_QUOTIENT = 5       # EIP-3529: refund capped at gasUsed / 5
+LOG_BASE = 375
+LOG_TOPIC = 375
+LOG_DATA_BYTE = 8
+
+def log_gas(topics: int, data_words: int) -> int:
+    """Gas for an event with `topics` topics (incl. signature) and ABI-encoded data words"""
+    return LOG_BASE + LOG_TOPIC * topics + LOG_DATA_BYTE * 32 * data_words
+
+# ============ CONTRACT CONSTANTS ============
+
+CALLBACK_GAS_LIMIT = 200000
+BASE_BLOCK_GAS_LIMIT = 150_000_000  # Raised periodically on Base - override with --block-gas-limit
+BASE_BLOCK_TIME = 2                 # Seconds
+# EIP-1559: gas target = limit / elasticity. Blocks above the target raise the
+# base fee, so only the target is sustainable (override with --elasticity)
+DEFAULT_ELASTICITY_MULTIPLIER = 2
+
+@dataclass
+class GasParams:
+    """
+    Estimated (non-opcode) costs and contract variant switches
+
+    The defaults describe DegenSlot as deployed with the DEGEN token (plain
+    OpenZeppelin ERC20) and the Chainlink VRF v2.5 coordinator.
+    """
+    exec_overhead: int = 2500             # Dispatch, ABI decode, memory, modifiers' jumps
+    external_call_overhead: int = 1000    # CALL stipend bookkeeping, returndata, SafeERC20 checks
+    vrf_request_gas: int = 60000          # Body of coordinator.requestRandomWords (subscription + commitment writes)
+    vrf_fulfill_overhead: int = 110000    # Coordinator proof verification + billing, outside the callback
+    callback_gas_limit: int = CALLBACK_GAS_LIMIT
+    nft_free_spins_enabled: bool = True
+    block_gas_limit: int = BASE_BLOCK_GAS_LIMIT
+    elasticity_multiplier: int = DEFAULT_ELASTICITY_MULTIPLIER
+
+    @property
+    def block_gas_target(self) -> int:
+        return self.block_gas_limit // self.elasticity_multiplier
+
+@dataclass
+class PlayerPopulation:
+    """
+    Player mix driving storage warmth and spin type
+
+    Each spin is played by a uniformly drawn player. The simulated period
+    covers `weeks` weeks of evenly spaced spins starting from launch, so a
+    player's first spin ever writes fresh (zero) slots.
+    """
+    num_players: int = 10_000
+    nft_holder_share: float = 0.10      # Players owning the free-spin NFT
+    infinite_approval_share: float = 0.50  # Players with max allowance (no allowance write)
+    empty_wallet_share: float = 0.20    # Payouts landing in a zero DEGEN balance
+    weeks: int = 4
+
+@dataclass
+class SpinPaths:
+    """Per-spin code path flags (one element per spin)"""
+    category: np.ndarray
+    payout: np.ndarray
+    nft_holder: np.ndarray
+    free_spin: np.ndarray
+    first_free_spin: np.ndarray
+    infinite_approval: np.ndarray
+    empty_wallet: np.ndarray
+
+@dataclass
+class GasReport:
+    """Gas per spin, split by transaction"""
+    spin_gas: np.ndarray          # spin() tx gasUsed (after refunds)
+    callback_gas: np.ndarray      # fulfillRandomWords execution, bounded by CALLBACK_GAS_LIMIT
+    fulfill_gas: np.ndarray       # Whole fulfillment tx gasUsed (after refunds)
+    paths: SpinPaths
+    params: GasParams = field(repr=False)
+
+    @property
+    def total_gas(self) -> np.ndarray:
+        return self.spin_gas + self.fulfill_gas
+
+    @property
+    def sustainable_spins_per_block(self) -> int:
+        """Spins per block at the mean spin+fulfill cost that keep blocks at the gas target"""
+        return int(self.params.block_gas_target // self.total_gas.mean())
+
+    @property
+    def peak_spins_per_block(self) -> int:
+        """Burst capacity: spins filling a whole block at the mean cost (base fee rises every block)"""
+        return int(self.params.block_gas_limit // self.total_gas.mean())
+
+    @property
+    def worst_case_sustainable_spins_per_block(self) -> int:
+        """Sustainable spins per block if every spin hit the most expensive path"""
+        return int(self.params.block_gas_target // self.total_gas.max())
+
+# ============ PER-PATH COSTS ============
+
+def spin_gas(params: GasParams, nft_holder, free_spin, first_free_spin,
+             infinite_approval) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gas used and refund of spin(), per path
+
+    Works on scalars or NumPy arrays of path flags.
+
+    Returns:
+        Tuple of (gas used before refunds, refund)
+    """
+    nft_holder = np.asarray(nft_holder, dtype=bool)
+    free_spin = np.asarray(free_spin, dtype=bool)
+    paid = ~free_spin
+
+    gas = (
+        TX_BASE + 4 * CALLDATA_NONZERO_BYTE + params.exec_overhead
+        # nonReentrant: read _status, 1 -> 2, then 2 -> 1 on exit
+        + COLD_SLOAD + SSTORE_RESET + WARM_SLOAD
+        # whenNotPaused: read _paused
+        + COLD_SLOAD
+        # hasPendingRequest[msg.sender] read
+        + COLD_SLOAD
+        # nftFreeSpinsEnabled / nftContract (packed in one slot)
+        + COLD_SLOAD
+    )
+    refund = SSTORE_RESTORE_REFUND  # _status restored to 1
+
+    if params.nft_free_spins_enabled:
+        # nftContract.balanceOf(msg.sender): cold NFT contract + cold balance slot
+        gas = gas + COLD_ACCOUNT_ACCESS + params.external_call_overhead + COLD_SLOAD
+        # Holders: lastFreeSpinTimestamp[msg.sender] read
+        gas = gas + np.where(nft_holder, COLD_SLOAD, 0)
+        # Free spin: lastFreeSpinTimestamp write (fresh slot on first free spin) + FreeSpinUsed
+        gas = gas + np.where(
+            free_spin,
+            np.where(first_free_spin, SSTORE_SET, SSTORE_RESET) + log_gas(2, 1),
+            0,
+        )
+
+    # Paid: safeTransferFrom (allowance, two balances, Transfer event), pot and treasuryBalance +=
+    transfer_from = (
+        COLD_ACCOUNT_ACCESS + params.external_call_overhead
+        + COLD_SLOAD + np.where(infinite_approval, 0, SSTORE_RESET)  # allowance
+        + COLD_SLOAD + SSTORE_RESET                                  # balance[player]
+        + COLD_SLOAD + SSTORE_RESET                                  # balance[this]
+        + log_gas(3, 1)                                              # Transfer
+    )
+    gas = gas + np.where(paid, transfer_from + 2 * (COLD_SLOAD + SSTORE_RESET), 0)
+
+    # pot < MIN_POT_AFTER_TOPUP: warm if just written, cold on free spins
+    gas = gas + np.where(paid, WARM_SLOAD, COLD_SLOAD)
+
+    gas = gas + (
+        # s_vrfCoordinator read + requestRandomWords
+        COLD_SLOAD + COLD_ACCOUNT_ACCESS + params.external_call_overhead + params.vrf_request_gas
+        # requestToPlayer[requestId] = msg.sender (new request id -> fresh slot)
+        + COLD_SLOAD + SSTORE_SET
+        # hasPendingRequest[msg.sender] = true (warm; cleared to 0 by the last fulfill)
+        + SSTORE_SET
+        # SpinInitiated (pot re-read warm)
+        + WARM_SLOAD + log_gas(3, 1)
+    )
+    return np.asarray(gas), np.full(np.shape(gas), refund)
+
+def callback_gas(params: GasParams, payout, empty_wallet) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gas used and refund of fulfillRandomWords, per path
+
+    This is the execution that must fit in CALLBACK_GAS_LIMIT.
+
+    Returns:
+        Tuple of (gas used before refunds, refund)
+    """
+    payout = np.asarray(payout, dtype=bool)
+
+    gas = (
+        params.exec_overhead
+        # rawFulfillRandomWords: msg.sender == s_vrfCoordinator
+        + COLD_SLOAD
+        # requestToPlayer[requestId] read
+        + COLD_SLOAD
+        # hasPendingRequest[player] = false (cold, nonzero -> zero)
+        + COLD_SLOAD + SSTORE_RESET
+        # delete requestToPlayer[requestId] (warm, nonzero -> zero)
+        + SSTORE_RESET
+        # pot read
+        + COLD_SLOAD
+        # SpinResult: player topic + roll, category, payout, potAfter
+        + log_gas(2, 4)
+    )
+    refund = 2 * SSTORE_CLEAR_REFUND
+
+    # Payout: pot write-back + safeTransfer (balance[this], balance[player], Transfer)
+    transfer = (
+        SSTORE_RESET
+        + COLD_ACCOUNT_ACCESS + params.external_call_overhead
+        + COLD_SLOAD + SSTORE_RESET
+        + COLD_SLOAD + np.where(empty_wallet, SSTORE_SET, SSTORE_RESET)
+        + log_gas(3, 1)
+    )
+    gas = gas + np.where(payout, transfer, 0)
+    return np.asarray(gas), np.full(np.shape(gas), refund)
+
+def apply_refund(gas: np.ndarray, refund: np.ndarray) -> np.ndarray:
+    """gasUsed after EIP-3529 refund cap"""
+    return gas - np.minimum(refund, gas // MAX_REFUND_QUOTIENT)
+
+def path_costs(params: GasParams = GasParams()) -> Dict[str, int]:
+    """
+    Gas per spin (spin + fulfill tx, after refunds) for each named code path
+
+    Cold/warm here refers to the player's slots: "fresh" writes a zero slot
+    (first free spin / empty wallet), "dirty" overwrites a nonzero one.
+    """
+    paths = {
+        "paid, no payout": dict(free=False, first=False, payout=False, empty=False),
+        "paid, payout (dirty wallet)": dict(free=False, first=False, payout=True, empty=False),
+        "paid, payout (fresh wallet)": dict(free=False, first=False, payout=True, empty=True),
+        "free (repeat), no payout": dict(free=True, first=False, payout=False, empty=False),
+        "free (first), no payout": dict(free=True, first=True, payout=False, empty=False),
+        "free (first), payout (fresh wallet)": dict(free=True, first=True, payout=True, empty=True),
+    }
+    costs = {}
+    for name, p in paths.items():
+        s_gas, s_refund = spin_gas(params, p["free"], p["free"], p["first"], False)
+        c_gas, c_refund = callback_gas(params, p["payout"], p["empty"])
+        fulfill = apply_refund(params.vrf_fulfill_overhead + c_gas, c_refund)
+        costs[name] = int(apply_refund(s_gas, s_refund) + fulfill)
+    return costs
+
+# ============ SIMULATION ============
+
+def categorize_rolls(rolls: np.ndarray,
+                     category_ranges: Dict[Cat, Tuple[int, int]] = CATEGORY_RANGES) -> np.ndarray:
+    """Map rolls to Cat values (vectorized _determineResult)"""
+    categories = np.full(rolls.shape, Cat.Nothing.value, dtype=np.uint8)
+    for category, (start, end) in category_ranges.items():
+        categories[(rolls >= start) & (rolls < end)] = category.value
+    return categories
+
+def simulate_paths(num_spins: int, population: PlayerPopulation, params: GasParams,
+                   rng: np.random.Generator,
+                   category_ranges: Dict[Cat, Tuple[int, int]] = CATEGORY_RANGES) -> SpinPaths:
+    """
+    Draw per-spin code paths
+
+    Free spins follow the contract's weekly rule, approximated with calendar
+    weeks: a holder's first spin in each week is free.
+    """
+    category = categorize_rolls(contract_rolls(num_spins, ROLL_MODULUS, rng), category_ranges)
+    payout = category != Cat.Nothing.value
+
+    holders = rng.random(population.num_players) < population.nft_holder_share
+    infinite = rng.random(population.num_players) < population.infinite_approval_share
+    player = rng.integers(population.num_players, size=num_spins)
+    week = np.arange(num_spins, dtype=np.int64) * population.weeks // num_spins
+
+    first_of_week = np.zeros(num_spins, dtype=bool)
+    _, idx = np.unique(player * population.weeks + week, return_index=True)
+    first_of_week[idx] = True
+
+    first_ever = np.zeros(num_spins, dtype=bool)
+    _, idx = np.unique(player, return_index=True)
+    first_ever[idx] = True
+
+    nft_holder = holders[player]
+    free_spin = params.nft_free_spins_enabled & nft_holder & first_of_week
+    return SpinPaths(
+        category=category,
+        payout=payout,
+        nft_holder=nft_holder,
+        free_spin=free_spin,
+        # A holder's first spin ever is always free, so it writes a fresh timestamp
+        first_free_spin=free_spin & first_ever,
+        infinite_approval=infinite[player],
+        empty_wallet=payout & (rng.random(num_spins) < population.empty_wallet_share),
+    )
+
+def simulate_gas(num_spins: int = 1_000_000,
+                 population: PlayerPopulation = PlayerPopulation(),
+                 params: GasParams = GasParams(),
+                 seed: int = 42,
+                 category_ranges: Dict[Cat, Tuple[int, int]] = CATEGORY_RANGES) -> GasReport:
+    """
+    Simulate gas for the specified number of spins
+
+    Args:
+        num_spins: Number of spins to simulate
+        population: Player mix
+        params: Cost estimates and contract variant
+        seed: NumPy seed
+        category_ranges: Paytable ranges (defaults to the contract's)
+
+    Returns:
+        GasReport with per-spin gas arrays
+    """
+    rng = np.random.default_rng(seed)
+    paths = simulate_paths(num_spins, population, params, rng, category_ranges)
+
+    s_gas, s_refund = spin_gas(params, paths.nft_holder, paths.free_spin,
+                               paths.first_free_spin, paths.infinite_approval)
+    c_gas, c_refund = callback_gas(params, paths.payout, paths.empty_wallet)
+    return GasReport(
+        spin_gas=apply_refund(s_gas, s_refund),
+        callback_gas=c_gas,
+        fulfill_gas=apply_refund(params.vrf_fulfill_overhead + c_gas, c_refund),
+        paths=paths,
+        params=params,
+    )
+
+# ============ REPORTING ============
+
+def print_gas_report(report: GasReport):
+    """Print formatted gas results"""
+    params = report.params
+    n = len(report.spin_gas)
+
+    print("⛽ DegenSlot Gas Model Results")
+    print("=" * 50)
+
+    print(f"\n📋 Per-Path Cost (spin + fulfill tx):")
+    for name, gas in path_costs(params).items():
+        print(f"  {name}: {gas:,}")
+
+    print(f"\n📊 Distribution over {n:,} spins:")
+    for label, values in (("spin()", report.spin_gas),
+                          ("fulfillRandomWords callback", report.callback_gas),
+                          ("fulfill tx", report.fulfill_gas),
+                          ("Total per spin", report.total_gas)):
+        p50, p95, p99 = np.percentile(values, [50, 95, 99])
+        print(f"  {label}: mean {values.mean():,.0f} | p50 {p50:,.0f} | "
+              f"p95 {p95:,.0f} | p99 {p99:,.0f} | max {values.max():,}")
+
+    print(f"\n🎯 Mean Total by Category:")
+    for category in Cat:
+        mask = report.paths.category == category.value
+        if mask.any():
+            print(f"  {category.name}: {report.total_gas[mask].mean():,.0f} ({mask.mean()*100:.2f}% of spins)")
+    print(f"  Free spins: {report.paths.free_spin.mean()*100:.2f}% of spins")
+
+    headroom = params.callback_gas_limit - report.callback_gas.max()
+    print(f"\n🧱 Throughput (block gas target {params.block_gas_target:,}, "
+          f"limit {params.block_gas_limit:,}):")
+    print(f"  Sustainable spins/block (at target): {report.sustainable_spins_per_block:,} "
+          f"({report.sustainable_spins_per_block / BASE_BLOCK_TIME:,.0f}/s)")
+    print(f"  Worst-case sustainable spins/block: {report.worst_case_sustainable_spins_per_block:,}")
+    print(f"  Peak spins/block (burst, at limit): {report.peak_spins_per_block:,} "
+          f"({report.peak_spins_per_block / BASE_BLOCK_TIME:,.0f}/s)")
+    print(f"  Callback headroom: {headroom:,} gas under CALLBACK_GAS_LIMIT "
+          f"{'✓' if headroom >= 0 else '✗'}")
+
+def main():
+    """Main gas model function"""
+    parser = argparse.ArgumentParser(description="DegenSlot gas cost model")
+    parser.add_argument("--spins", type=int, default=1_000_000)
+    parser.add_argument("--players", type=int, default=PlayerPopulation.num_players)
+    parser.add_argument("--nft-holder-share", type=float, default=PlayerPopulation.nft_holder_share)
+    parser.add_argument("--no-free-spins", action="store_true", help="Disable NFT free spins")
+    parser.add_argument("--block-gas-limit", type=int, default=BASE_BLOCK_GAS_LIMIT)
+    parser.add_argument("--elasticity", type=int, default=DEFAULT_ELASTICITY_MULTIPLIER,
+                        help="EIP-1559 elasticity multiplier (gas target = limit / elasticity)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    population = replace(PlayerPopulation(), num_players=args.players,
+                         nft_holder_share=args.nft_holder_share)
+    params = replace(GasParams(), nft_free_spins_enabled=not args.no_free_spins,
+                     block_gas_limit=args.block_gas_limit,
+                     elasticity_multiplier=args.elasticity)
+
+    print(f"⛽ Simulating gas for {args.spins:,} spins ({args.players:,} players)...\n")
+    print_gas_report(simulate_gas(args.spins, population, params, args.seed))
+
+if __name__ == "__main__":
+    main()
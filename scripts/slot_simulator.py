@@ -8,13 +8,21 @@ Simulates 1,000,000+ spins of the DegenSlot game to verify:
 - Pot behavior with steady-state around 15k
 - Treasury accumulation (30% house edge)
 - New One-Hat and Two-Hats categories
+- Modulo bias of the VRF word -> roll reduction (exact)
 
 This simulator mirrors the exact logic from the Solidity contract.
+
+Rolls come from one of two RNG modes:
+- Fast: random.randint(0, 9999)
+- Contract: 256-bit VRF words reduced with `% 10000` exactly as in
+  fulfillRandomWords (requires NumPy)
 """
 
 import random
 import statistics
-from typing import Dict, List, Tuple
+import sys
+from fractions import Fraction
+from typing import Dict, Iterator, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -29,6 +37,11 @@ class Cat(Enum):
     OneHat = 4
     TwoHats = 5
 
+class RngMode(Enum):
+    """Source of spin rolls"""
+    Fast = "fast"          # random.randint(0, 9999)
+    Contract = "contract"  # uint256 VRF word % 10000, as on-chain
+
 # ============ CONSTANTS (matching Solidity contract) ============
 
 COST_PER_SPIN = 100
@@ -65,6 +78,22 @@ TWO_HATS_RANGE_END = P_JACKPOT_BPS + P_THREE_SAME_BPS + P_TWO_SAME_BPS + P_ONE_H
 NOTHING_RANGE_START = P_JACKPOT_BPS + P_THREE_SAME_BPS + P_TWO_SAME_BPS + P_ONE_HAT_BPS + P_TWO_HATS_BPS
 NOTHING_RANGE_END = 10000
 
+# VRF reduction (fulfillRandomWords)
+VRF_WORD_BITS = 256
+ROLL_MODULUS = 10000            # DegenSlot: randomWords[0] % 10000
+GUESSR_MAX_GUESS = 100          # DegenGuessr: randomWords[0] % MAX_GUESS + 1
+GUESSR_1000_MAX_GUESS = 10      # DegenGuessr1000: randomWords[0] % MAX_GUESS + 1
+CONTRACT_ROLL_CHUNK = 1 << 16   # Words generated per NumPy batch
+
+CATEGORY_RANGES = {
+    Cat.Jackpot: (JACKPOT_RANGE_START, JACKPOT_RANGE_END),
+    Cat.ThreeSame: (THREE_SAME_RANGE_START, THREE_SAME_RANGE_END),
+    Cat.TwoSame: (TWO_SAME_RANGE_START, TWO_SAME_RANGE_END),
+    Cat.OneHat: (ONE_HAT_RANGE_START, ONE_HAT_RANGE_END),
+    Cat.TwoHats: (TWO_HATS_RANGE_START, TWO_HATS_RANGE_END),
+    Cat.Nothing: (NOTHING_RANGE_START, NOTHING_RANGE_END),
+}
+
 @dataclass
 class SpinResult:
     """Result of a single spin"""
@@ -100,6 +129,118 @@ class SimulationStats:
     pot_max: int
     pot_below_2000_count: int
 
+@dataclass
+class ModuloBias:
+    """Exact distribution of `word % modulus` for a uniform word_bits-bit word"""
+    modulus: int
+    word_bits: int
+    quotient: int           # floor(2**word_bits / modulus)
+    remainder: int          # 2**word_bits % modulus: values [0, remainder) are favored
+    p_favored: Fraction     # P(x) for x < remainder
+    p_other: Fraction       # P(x) for x >= remainder
+    max_relative_bias: float  # max |P(x) * modulus - 1|
+
+def analyze_modulo_bias(modulus: int, word_bits: int = VRF_WORD_BITS) -> ModuloBias:
+    """
+    Exact bias of reducing a uniform word with `% modulus`
+
+    Args:
+        modulus: Reduction modulus (10000 for the slot, MAX_GUESS for Guessr)
+        word_bits: Width of the random word (256 for Chainlink VRF)
+
+    Returns:
+        ModuloBias with exact per-value probabilities
+    """
+    space = 1 << word_bits
+    quotient, remainder = divmod(space, modulus)
+    p_favored = Fraction(quotient + 1, space)
+    p_other = Fraction(quotient, space)
+    max_relative_bias = max(
+        abs(p_favored * modulus - 1) if remainder else Fraction(0),
+        abs(p_other * modulus - 1),
+    )
+    return ModuloBias(
+        modulus=modulus,
+        word_bits=word_bits,
+        quotient=quotient,
+        remainder=remainder,
+        p_favored=p_favored,
+        p_other=p_other,
+        max_relative_bias=float(max_relative_bias),
+    )
+
+def exact_category_probabilities(word_bits: int = VRF_WORD_BITS) -> Dict[Cat, Fraction]:
+    """
+    Exact category probabilities under `randomWords[0] % 10000`
+
+    Args:
+        word_bits: Width of the random word
+
+    Returns:
+        Mapping of category -> exact probability
+    """
+    bias = analyze_modulo_bias(ROLL_MODULUS, word_bits)
+    space = 1 << word_bits
+    probabilities = {}
+    for category, (start, end) in CATEGORY_RANGES.items():
+        favored = max(0, min(end, bias.remainder) - start)
+        words = (end - start) * bias.quotient + favored
+        probabilities[category] = Fraction(words, space)
+    return probabilities
+
+def contract_rolls(num_rolls: int, modulus: int, rng) -> "np.ndarray":
+    """
+    Draw rolls exactly as `uint256(word) % modulus`, vectorized
+
+    Each word is 32 bytes from `rng.bytes`, read big-endian as four uint64
+    lanes. Since word = sum(lane_i * 2**(64 * (3 - i))), the reduction is
+    sum((lane_i % m) * (2**(64 * (3 - i)) % m)) % m, which never overflows
+    uint64 for m < 2**31.
+
+    Args:
+        num_rolls: Number of rolls to draw
+        modulus: Reduction modulus
+        rng: numpy.random.Generator
+
+    Returns:
+        uint64 array of rolls in [0, modulus)
+    """
+    import numpy as np
+
+    if not 0 < modulus < 1 << 31:
+        raise ValueError(f"modulus must be in (0, 2**31), got {modulus}")
+
+    lanes_per_word = VRF_WORD_BITS // 64
+    lanes = np.frombuffer(rng.bytes(num_rolls * VRF_WORD_BITS // 8), dtype=">u8")
+    lanes = lanes.reshape(num_rolls, lanes_per_word).astype(np.uint64)
+    m = np.uint64(modulus)
+    weights = np.array(
+        [pow(2, 64 * (lanes_per_word - 1 - i), modulus) for i in range(lanes_per_word)],
+        dtype=np.uint64,
+    )
+    return ((lanes % m) * weights).sum(axis=1, dtype=np.uint64) % m
+
+def roll_stream(num_spins: int, rng_mode: RngMode = RngMode.Fast) -> Iterator[int]:
+    """
+    Yield spin rolls (0-9999) from the selected RNG mode
+
+    Contract mode seeds its NumPy Generator from `random`, so random.seed()
+    keeps both modes reproducible.
+    """
+    if rng_mode == RngMode.Fast:
+        for _ in range(num_spins):
+            yield random.randint(0, ROLL_MODULUS - 1)
+        return
+
+    import numpy as np
+
+    rng = np.random.default_rng(random.getrandbits(128))
+    remaining = num_spins
+    while remaining > 0:
+        n = min(remaining, CONTRACT_ROLL_CHUNK)
+        yield from contract_rolls(n, ROLL_MODULUS, rng).tolist()
+        remaining -= n
+
 def determine_result(roll: int, current_pot: int) -> Tuple[Cat, int]:
     """
     Determine spin result based on roll (matching contract logic)
@@ -125,13 +266,15 @@ def determine_result(roll: int, current_pot: int) -> Tuple[Cat, int]:
     else:
         return Cat.Nothing, 0
 
-def simulate_spins(num_spins: int = 1_000_000, pot_seed: int = 15_000) -> SimulationStats:
+def simulate_spins(num_spins: int = 1_000_000, pot_seed: int = 15_000,
+                   rng_mode: RngMode = RngMode.Fast) -> SimulationStats:
     """
     Simulate the specified number of spins
     
     Args:
         num_spins: Number of spins to simulate
         pot_seed: Initial pot seed amount
+        rng_mode: Fast (randint) or Contract (uint256 % 10000) rolls
         
     Returns:
         SimulationStats object with results
@@ -152,6 +295,8 @@ def simulate_spins(num_spins: int = 1_000_000, pot_seed: int = 15_000) -> Simula
     # Track pot values for statistics
     pot_values = [pot]
     
+    rolls = roll_stream(num_spins, rng_mode)
+    
     # Simulate spins
     for spin_num in range(num_spins):
         # Add to pot and treasury (before payout)
@@ -164,8 +309,8 @@ def simulate_spins(num_spins: int = 1_000_000, pot_seed: int = 15_000) -> Simula
             print(f"⚠️  Pot too small for fixed payouts: {pot} < {MIN_POT_AFTER_TOPUP} (spin {spin_num + 1})")
             # In real contract, this would revert, but for simulation we continue
         
-        # Generate random roll (0-9999)
-        roll = random.randint(0, 9999)
+        # Next random roll (0-9999)
+        roll = next(rolls)
         
         # Determine result
         category, payout = determine_result(roll, pot)
@@ -312,8 +457,26 @@ def verify_probability_ranges():
     print(f"  Total: {total_range} bps (should be 10000)")
     print(f"  Ranges are correct: {'✓' if total_range == 10000 else '✗'}")
 
+def print_bias_report():
+    """Print the exact modulo bias of each contract's VRF reduction"""
+    print("\n🎲 VRF Modulo Bias (uint256 word):")
+    for name, modulus in (("DegenSlot % 10000", ROLL_MODULUS),
+                          ("DegenGuessr % MAX_GUESS", GUESSR_MAX_GUESS),
+                          ("DegenGuessr1000 % MAX_GUESS", GUESSR_1000_MAX_GUESS)):
+        bias = analyze_modulo_bias(modulus)
+        print(f"  {name}: 2^256 % {modulus} = {bias.remainder} "
+              f"(values < {bias.remainder} favored), max relative bias {bias.max_relative_bias:.3e}")
+    
+    print("  DegenSlot category probabilities (exact vs bps):")
+    for category, p in exact_category_probabilities().items():
+        start, end = CATEGORY_RANGES[category]
+        nominal = Fraction(end - start, ROLL_MODULUS)
+        print(f"    {category.name}: {float(p):.6%} | relative deviation {float((p - nominal) / nominal):+.3e}")
+
 def main():
     """Main simulation function"""
+    rng_mode = RngMode(sys.argv[1]) if len(sys.argv) > 1 else RngMode.Fast
+    
     print("🎰 Starting DegenSlot Simulation...")
     print(f"Simulating 1,000,000+ spins with the following parameters:")
     print(f"  Cost per spin: {COST_PER_SPIN} $DEGEN")
@@ -322,12 +485,14 @@ def main():
     print(f"  Initial pot seed: 5,000 $DEGEN")
     print(f"  Expected RTP: ~70%")
     print(f"  Expected steady-state pot: ~4,600 $DEGEN")
+    print(f"  RNG mode: {rng_mode.value}")
     
     verify_probability_ranges()
+    print_bias_report()
     
     # Run simulation
     print(f"\n🎲 Running simulation...")
-    stats = simulate_spins(1_000_000, pot_seed=5_000)  # 5000 DEGEN initial pot
+    stats = simulate_spins(1_000_000, pot_seed=5_000, rng_mode=rng_mode)  # 5000 DEGEN initial pot
     
     # Print results
     print_simulation_results(stats)
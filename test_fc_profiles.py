@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Tests for the bulk Farcaster profile resolver
+Runs against a local stub of /api/fc/users-by-address (no network required)
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scripts.fc_profiles import (
+    ProfileCache, ProfileResolver, FarcasterProfile, normalize_addresses,
+    MAX_ADDRESSES_PER_REQUEST
+)
+
+def make_address(i: int) -> str:
+    return "0x" + f"{i:040x}"
+
+class StubServer:
+    """
+    Stub users-by-address route: even-numbered addresses have a profile
+
+    With `broken=True` it mimics the route's error path (HTTP 200, empty result)
+    """
+
+    def __init__(self, broken: bool = False):
+        self.batch_sizes = []
+        self.broken = broken
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                addresses = json.loads(body)["addresses"]
+                with stub.lock:
+                    stub.batch_sizes.append(len(addresses))
+                result = []
+                for a in ([] if stub.broken else addresses):
+                    users = []
+                    if int(a, 16) % 2 == 0:
+                        users = [{"fid": int(a, 16), "username": f"user{int(a, 16)}", "pfp": None}]
+                    result.append({"address": a, "users": users})
+                data = json.dumps({"result": result}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+def test_normalize_addresses():
+    """Test lowercase + dedupe preserving order"""
+    print("🧪 Testing address normalization...")
+
+    addrs = normalize_addresses(["0xABC", "0xabc", "0xdef", "", "0xDEF", "0x123"])
+    assert addrs == ["0xabc", "0xdef", "0x123"], f"Unexpected normalization: {addrs}"
+
+    print("✅ Addresses are normalized and deduplicated")
+
+def test_batching_and_dedupe():
+    """Test that lookups are deduplicated and sent in maximum-size batches"""
+    print("🧪 Testing batching and deduplication...")
+
+    stub = StubServer()
+    try:
+        addresses = [make_address(i) for i in range(1000)]
+        # Duplicates in mixed case must not produce extra lookups
+        addresses += [a.upper().replace("0X", "0x") for a in addresses[:200]]
+
+        resolver = ProfileResolver(stub.url, batch_size=300, max_concurrency=4)
+        profiles = resolver.resolve(addresses)
+        resolver.close()
+
+        assert len(profiles) == 1000, f"Expected 1000 unique addresses, got {len(profiles)}"
+        assert sorted(stub.batch_sizes) == [100, 300, 300, 300], f"Unexpected batches: {stub.batch_sizes}"
+        assert resolver.round_trips == 4, f"Expected 4 round trips, got {resolver.round_trips}"
+
+        assert profiles[make_address(2)] == FarcasterProfile(
+            fid=2, username="user2", pfp=None, wallet_address=make_address(2)
+        )
+        assert profiles[make_address(3)] is None, "Odd addresses have no profile"
+    finally:
+        stub.close()
+
+    print("✅ Lookups are deduplicated and batched")
+
+def test_large_report_round_trips():
+    """Test that a 100k-address report needs ceil(100k / batch) round trips"""
+    print("🧪 Testing 100k-address report...")
+
+    stub = StubServer()
+    try:
+        addresses = [make_address(i) for i in range(100_000)]
+        resolver = ProfileResolver(stub.url)
+        profiles = resolver.resolve(addresses)
+        resolver.close()
+
+        expected = -(-100_000 // MAX_ADDRESSES_PER_REQUEST)
+        assert len(profiles) == 100_000
+        assert resolver.round_trips == expected, f"Expected {expected} round trips, got {resolver.round_trips}"
+        assert max(stub.batch_sizes) == MAX_ADDRESSES_PER_REQUEST
+    finally:
+        stub.close()
+
+    print(f"✅ 100k addresses resolved in {expected} round trips")
+
+def test_cache_hits_skip_network():
+    """Test that cached addresses (including misses) are not re-fetched"""
+    print("🧪 Testing on-disk cache...")
+
+    stub = StubServer()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "profiles.sqlite")
+        try:
+            addresses = [make_address(i) for i in range(500)]
+
+            resolver = ProfileResolver(stub.url, cache=ProfileCache(path), batch_size=250)
+            first = resolver.resolve(addresses)
+            resolver.close()
+            assert resolver.round_trips == 2
+
+            # A new resolver on the same cache file serves everything from disk
+            resolver = ProfileResolver(stub.url, cache=ProfileCache(path), batch_size=250)
+            second = resolver.resolve(addresses + [make_address(500)])
+            resolver.close()
+
+            assert resolver.round_trips == 1, f"Only the new address should be fetched, got {resolver.round_trips}"
+            assert resolver.cache_hits == 500, f"Expected 500 cache hits, got {resolver.cache_hits}"
+            assert all(second[a] == first[a] for a in addresses), "Cached profiles differ from fetched ones"
+        finally:
+            stub.close()
+
+    print("✅ Cache serves repeated lookups")
+
+def test_empty_result_is_not_cached():
+    """Test that the route's 200 {"result": []} error response is a failed batch"""
+    print("🧪 Testing error responses are not cached...")
+
+    stub = StubServer(broken=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "profiles.sqlite")
+        try:
+            addresses = [make_address(i) for i in range(10)]
+            cache = ProfileCache(path)
+            resolver = ProfileResolver(stub.url, cache=cache)
+            profiles = resolver.resolve(addresses)
+
+            assert all(profiles[a] is None for a in addresses), "Failed lookups should resolve to None"
+            assert resolver.failed_batches == 1, f"Expected 1 failed batch, got {resolver.failed_batches}"
+            assert len(cache) == 0, f"Failed lookups should not be cached, found {len(cache)} entries"
+            resolver.close()
+        finally:
+            stub.close()
+
+    print("✅ Error responses are retried on the next run")
+
+def test_cache_ttl_and_lru():
+    """Test TTL expiry and LRU eviction"""
+    print("🧪 Testing cache TTL and LRU eviction...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ProfileCache(os.path.join(tmp, "profiles.sqlite"), ttl=0.2, max_entries=2)
+        a, b, c = make_address(1), make_address(2), make_address(3)
+
+        cache.set_many({a: None, b: None})
+        time.sleep(0.01)
+        cache.get_many([a])  # a is now more recently used than b
+        time.sleep(0.01)
+        cache.set_many({c: None})
+
+        assert len(cache) == 2, f"Cache should hold 2 entries, got {len(cache)}"
+        assert set(cache.get_many([a, b, c])) == {a, c}, "Least recently used entry should be evicted"
+
+        time.sleep(0.25)
+        assert cache.get_many([a, c]) == {}, "Expired entries should not be returned"
+        cache.close()
+
+    print("✅ TTL expiry and LRU eviction work")
+
+def main():
+    """Run all tests"""
+    print("🔍 Farcaster Profile Resolver Tests")
+    print("=" * 40)
+
+    try:
+        test_normalize_addresses()
+        test_batching_and_dedupe()
+        test_large_report_round_trips()
+        test_cache_hits_skip_network()
+        test_empty_result_is_not_cached()
+        test_cache_ttl_and_lru()
+
+        print("\n🎉 All tests passed!")
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n💥 Unexpected error: {e}")
+        return False
+
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
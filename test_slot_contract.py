@@ -5,8 +5,11 @@ Tests the core game mechanics without requiring a blockchain connection
 """
 
 import random
+from fractions import Fraction
 from scripts.slot_simulator import (
-    determine_result, Cat, 
+    determine_result, Cat, RngMode,
+    analyze_modulo_bias, exact_category_probabilities, contract_rolls, roll_stream,
+    ROLL_MODULUS, VRF_WORD_BITS, 
     P_JACKPOT_BPS, P_THREE_SAME_BPS, P_TWO_SAME_BPS, 
     P_ONE_HAT_BPS, P_TWO_HATS_BPS, P_NOTHING_BPS,
     THREE_SAME_PAYOUT, TWO_SAME_PAYOUT, ONE_HAT_PAYOUT, TWO_HATS_PAYOUT
@@ -159,6 +162,66 @@ def test_monte_carlo_validation():
     print(f"   Jackpot: {jackpot_prob:.4f} (expected {expected_jackpot:.4f})")
     print(f"   One Hat: {one_hat_prob:.4f} (expected {expected_one_hat:.4f})")
 
+def test_modulo_bias_exact():
+    """Test the exact modulo bias analysis of word % modulus"""
+    print("🧪 Testing exact modulo bias...")
+    
+    # 4-bit words % 10: values 0-5 occur twice, 6-9 once (16 = 1*10 + 6)
+    bias = analyze_modulo_bias(10, word_bits=4)
+    assert (bias.quotient, bias.remainder) == (1, 6), f"Unexpected divmod: {bias}"
+    assert bias.p_favored == Fraction(2, 16) and bias.p_other == Fraction(1, 16)
+    assert bias.p_favored * bias.remainder + bias.p_other * (10 - bias.remainder) == 1
+    
+    # Brute force check on small words
+    for modulus, bits in ((7, 5), (10, 8), (100, 10)):
+        bias = analyze_modulo_bias(modulus, word_bits=bits)
+        counts = [0] * modulus
+        for word in range(1 << bits):
+            counts[word % modulus] += 1
+        expected = [bias.p_favored if x < bias.remainder else bias.p_other for x in range(modulus)]
+        assert [Fraction(c, 1 << bits) for c in counts] == expected, f"Mismatch for {modulus}, {bits} bits"
+    
+    # 256-bit words: 2**256 % 10000 == 9936, bias is negligible
+    bias = analyze_modulo_bias(ROLL_MODULUS)
+    assert bias.remainder == 9936, f"2**256 % 10000 should be 9936, got {bias.remainder}"
+    assert bias.max_relative_bias < 1e-70, f"Bias should be negligible, got {bias.max_relative_bias}"
+    
+    probabilities = exact_category_probabilities()
+    assert sum(probabilities.values()) == 1, "Category probabilities should sum to 1"
+    assert abs(float(probabilities[Cat.Jackpot]) - P_JACKPOT_BPS / 10000) < 1e-15
+    
+    print("✅ Modulo bias analysis is exact")
+
+def test_contract_rolls_match_uint256_modulo():
+    """Test that vectorized contract rolls equal int.from_bytes(word) % modulus"""
+    print("🧪 Testing contract-faithful rolls...")
+    
+    try:
+        import numpy as np
+    except ImportError:
+        print("⏭️  NumPy not installed, skipping")
+        return
+    
+    word_bytes = VRF_WORD_BITS // 8
+    for modulus in (ROLL_MODULUS, 100, 10, 7):
+        rolls = contract_rolls(1000, modulus, np.random.default_rng(1234))
+        raw = np.random.default_rng(1234).bytes(1000 * word_bytes)
+        expected = [
+            int.from_bytes(raw[i:i + word_bytes], "big") % modulus
+            for i in range(0, len(raw), word_bytes)
+        ]
+        assert rolls.tolist() == expected, f"Vectorized rolls differ from uint256 % {modulus}"
+    
+    # Seeded through `random`, like the fast mode
+    random.seed(42)
+    first = list(roll_stream(100_000, RngMode.Contract))
+    random.seed(42)
+    second = list(roll_stream(100_000, RngMode.Contract))
+    assert first == second, "Contract mode should be reproducible under random.seed"
+    assert min(first) >= 0 and max(first) < ROLL_MODULUS
+    
+    print("✅ Contract rolls match on-chain reduction")
+
 def main():
     """Run all tests"""
     print("🎰 DegenSlot Contract Logic Tests")
@@ -171,6 +234,8 @@ def main():
         test_jackpot_percentage()
         test_edge_cases()
         test_monte_carlo_validation()
+        test_modulo_bias_exact()
+        test_contract_rolls_match_uint256_modulo()
         
         print("\n🎉 All tests passed! Contract logic is working correctly.")
         